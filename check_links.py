@@ -1,22 +1,42 @@
 #!/usr/bin/env python3
 """
 Check the validity of links in awesome-openclaw-skills README.md.
-Uses HEAD requests to check status codes, supports increasing GitHub API rate limits via GITHUB_TOKEN environment variable.
+Uses HEAD requests to check status codes, supports increasing GitHub API rate limits via GITHUB_TOKEN environment variable
+(or several comma-separated tokens in GITHUB_TOKENS, used in rotation).
 """
 
 import argparse
+import base64
+import bisect
+import http.client
+import itertools
+import json
+import mmap
 import os
+import queue
+import socket
 import re
+import sqlite3
 import ssl
 import sys
+import threading
 import time
 import urllib.request
-import urllib.error
+from array import array
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from dataclasses import dataclass
-from http.client import HTTPResponse
-from typing import Optional
-from urllib.parse import urlparse
+from email.utils import parsedate_to_datetime
+from typing import Optional, Union
+from urllib.parse import quote, unquote, urljoin, urlparse
+
+
+USER_AGENT = 'awesome-openclaw-skills-link-checker/1.0'
+
+# Skill entries: "- [skill-name](https://github.com/openclaw/skills/...)"
+# The whole file is scanned at once, so no part of a match may cross a newline
+LINK_RE = re.compile(rb'-[^\S\n]+\[([^\]\n]+)\]\((https://github\.com/openclaw/skills/[^\)\n]+)\)')
+NEWLINE_RE = re.compile(rb'\n')
 
 
 @dataclass
@@ -31,186 +51,975 @@ class LinkResult:
     is_valid: bool
 
 
-def extract_links_from_readme(filepath: str) -> list[tuple[str, str, int, str]]:
+@dataclass
+class RepoTree:
+    """Known paths of a GitHub repository at one ref, built from the Git Trees API"""
+    paths: set[str]
+    # Directories whose direct children are all in paths ('' is the repo root)
+    listed: set[str]
+    # Directories whose whole subtree is in paths
+    complete: set[str]
+    
+    def contains(self, path: str) -> Optional[bool]:
+        """Return whether path exists, or None if the tree wasn't fetched deep enough to tell."""
+        if path in self.paths:
+            return True
+        
+        child = path
+        while child:
+            parent = child.rpartition('/')[0]
+            if parent in self.complete:
+                return False
+            if parent in self.listed and child not in self.paths:
+                return False
+            child = parent
+        return None
+
+
+@dataclass
+class ReadmeSource:
+    """README contents kept from link extraction, so rewriting needs no second read"""
+    buf: Union[mmap.mmap, bytes]
+    # Offset of every newline in buf
+    newlines: array
+    
+    def line_span(self, line_num: int) -> tuple[int, int]:
+        """Return the [start, end) byte range of a line, including its newline."""
+        index = line_num - 1
+        start = self.newlines[index - 1] + 1 if index else 0
+        end = self.newlines[index] + 1 if index < len(self.newlines) else len(self.buf)
+        return (start, end)
+    
+    def close(self) -> None:
+        if isinstance(self.buf, mmap.mmap):
+            self.buf.close()
+
+
+class TokenPool:
     """
-    Extract all skill links from README.md.
+    Round-robin pool of GitHub tokens.
+    
+    Each token has its own rate limit, so rotating through several multiplies
+    the available quota. Tokens reported (via X-RateLimit-* response headers)
+    to be nearly exhausted are skipped until their limit resets.
+    """
+    
+    def __init__(self, tokens: list[str], min_remaining: int = 10):
+        self.tokens = tokens
+        self.min_remaining = min_remaining
+        self._cycle = itertools.cycle(tokens)
+        # token -> (remaining, reset epoch)
+        self._limits: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.tokens)
+    
+    def next(self) -> Optional[str]:
+        """Return the next usable token, or None if the pool is empty."""
+        if not self.tokens:
+            return None
+        
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self.tokens)):
+                token = next(self._cycle)
+                remaining, reset = self._limits.get(token, (self.min_remaining + 1, 0))
+                if remaining > self.min_remaining or now >= reset:
+                    return token
+            
+            # Every token is nearly exhausted, use the one that resets first
+            return min(self.tokens, key=lambda token: self._limits[token][1])
+    
+    def update(self, token: Optional[str], headers: http.client.HTTPMessage) -> None:
+        """Record the rate limit state reported in a GitHub API response."""
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if token is None or remaining is None or reset is None:
+            return
+        
+        try:
+            with self._lock:
+                self._limits[token] = (int(remaining), int(reset))
+        except ValueError:
+            pass
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how fast requests are sent.
     
-    Returns: [(skill_name, url, line_num, original_line), ...]
+    Tokens refill at rate per second up to capacity. A caller that finds the
+    bucket empty reserves the next token and sleeps until it is due, so the
+    issue rate is smoothed without holding the lock while waiting.
     """
-    pattern = re.compile(r'-\s+\[([^\]]+)\]\((https://github\.com/openclaw/skills/[^\)]+)\)')
     
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ProgressPrinter:
+    """
+    Writes progress lines to stdout from a background thread.
+    
+    The checking loop only queues messages; the writer drains whatever has
+    piled up and writes it as one chunk, so console I/O neither blocks the
+    loop nor costs one write per line.
+    """
+    
+    def __init__(self):
+        self._queue: queue.Queue[Optional[str]] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def print(self, message: str) -> None:
+        self._queue.put(message)
+    
+    def _run(self) -> None:
+        while True:
+            messages = [self._queue.get()]
+            while True:
+                try:
+                    messages.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            text = ''.join(f"{message}\n" for message in messages if message is not None)
+            if text:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            
+            # None is queued by close() as the last message
+            if messages[-1] is None:
+                return
+    
+    def close(self) -> None:
+        """Write out everything queued so far and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+    
+    def __enter__(self) -> 'ProgressPrinter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class HTTPSession:
+    """
+    Minimal thread-safe HTTP client that reuses keep-alive connections.
+    
+    Idle connections are pooled per (scheme, host), so worker threads share
+    TCP+TLS sessions instead of paying a fresh handshake for every request.
+    An optional rate limiter is applied before every request sent.
+    
+    Transient connection errors and statuses (429, 5xx) are retried with
+    exponential backoff, honouring Retry-After when the server sends it.
+    Backoff is abandoned as soon as stop_event is set.
+    
+    Proxies are taken from the environment (HTTPS_PROXY, HTTP_PROXY, NO_PROXY)
+    like urllib does: HTTPS goes through a CONNECT tunnel, plain HTTP sends
+    absolute URLs to the proxy.
+    """
+    
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    def __init__(
+        self,
+        timeout: int = 10,
+        pool_maxsize: int = 10,
+        max_redirects: int = 5,
+        rate_limiter: Optional[TokenBucket] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_retry_wait: float = 60,
+        stop_event: Optional[threading.Event] = None
+    ):
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.max_redirects = max_redirects
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_retry_wait = max_retry_wait
+        self.stop_event = stop_event or threading.Event()
+        self._ssl_context = ssl.create_default_context()
+        self._proxies = urllib.request.getproxies()
+        self._pools: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+    
+    def _proxy_for(self, scheme: str, netloc: str) -> Optional[tuple[str, dict[str, str]]]:
+        """
+        Find the proxy to use for a host.
+        
+        Returns: (proxy_netloc, proxy_headers), or None to connect directly
+        """
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(urlparse(f"{scheme}://{netloc}").hostname or netloc):
+            return None
+        
+        parsed_proxy = urlparse(proxy if '://' in proxy else f"http://{proxy}")
+        proxy_headers = {}
+        if parsed_proxy.username is not None:
+            credentials = f"{unquote(parsed_proxy.username)}:{unquote(parsed_proxy.password or '')}"
+            proxy_headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode()
+        return (parsed_proxy.netloc.rpartition('@')[2], proxy_headers)
+    
+    def _acquire(self, scheme: str, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+        """Take an idle pooled connection, or open a new one. Returns (conn, reused)."""
+        with self._lock:
+            idle = self._pools.get((scheme, netloc))
+            if idle:
+                return (idle.pop(), True)
+        
+        return (self._new_connection(scheme, netloc), False)
+    
+    def _new_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Create a connection (not yet connected) to a host, through a proxy if configured."""
+        proxy = self._proxy_for(scheme, netloc)
+        host = proxy[0] if proxy else netloc
+        
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, timeout=self.timeout, context=self._ssl_context)
+            if proxy:
+                conn.set_tunnel(netloc, headers=proxy[1])
+        else:
+            conn = http.client.HTTPConnection(host, timeout=self.timeout)
+        return conn
+    
+    def _release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            idle = self._pools.setdefault((scheme, netloc), [])
+            if len(idle) < self.pool_maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+    
+    def _send(self, method: str, url: str, headers: dict[str, str]) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a single request without following redirects."""
+        parsed = urlparse(url)
+        target = parsed.path or '/'
+        if parsed.query:
+            target += '?' + parsed.query
+        
+        # A plain HTTP proxy expects the absolute URL as the request target
+        proxy = self._proxy_for(parsed.scheme, parsed.netloc) if parsed.scheme == 'http' else None
+        if proxy:
+            target = f"http://{parsed.netloc}{target}"
+            headers = {**headers, **proxy[1]}
+        
+        while True:
+            conn, reused = self._acquire(parsed.scheme, parsed.netloc)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            
+            try:
+                conn.request(method, target, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                # The server may have dropped an idle keep-alive connection, retry on a fresh one
+                if reused:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(parsed.scheme, parsed.netloc, conn)
+            
+            return (response.status, response.headers, body)
+    
+    def _retry_wait(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Seconds to wait before retry number attempt + 1."""
+        wait = self.backoff_factor * (2 ** attempt)
+        
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                # HTTP-date form
+                try:
+                    wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+        
+        return min(max(wait, 0), self.max_retry_wait)
+    
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Whether a failed request is worth retrying."""
+        # Bad certificates don't fix themselves, and a timed out request has
+        # already waited the full timeout
+        if isinstance(error, (ssl.SSLCertVerificationError, TimeoutError)):
+            return False
+        # Unknown hosts stay unknown, only a temporary resolver failure is retried
+        if isinstance(error, socket.gaierror):
+            return error.errno == socket.EAI_AGAIN
+        return isinstance(error, (OSError, http.client.HTTPException))
+    
+    def _send_with_retries(self, method: str, url: str, headers: dict[str, str]) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a single request, retrying transient connection errors and statuses."""
+        for attempt in range(self.retries + 1):
+            is_last_attempt = attempt == self.retries
+            
+            try:
+                status_code, response_headers, body = self._send(method, url, headers)
+            except (OSError, http.client.HTTPException) as e:
+                # Event.wait returns True once the run is stopping
+                if is_last_attempt or not self._is_transient(e) or self.stop_event.wait(self._retry_wait(attempt, None)):
+                    raise
+                continue
+            
+            if status_code not in self.RETRY_STATUSES or is_last_attempt:
+                break
+            if self.stop_event.wait(self._retry_wait(attempt, response_headers.get('Retry-After'))):
+                break
+        
+        return (status_code, response_headers, body)
+    
+    def request(self, method: str, url: str, headers: Optional[dict[str, str]] = None) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        Send a request, following redirects and retrying transient failures.
+        
+        Returns: (status_code, response_headers, body)
+        """
+        headers = {'User-Agent': USER_AGENT, **(headers or {})}
+        
+        for _ in range(self.max_redirects + 1):
+            status_code, response_headers, body = self._send_with_retries(method, url, headers)
+            location = response_headers.get('Location')
+            if status_code not in (301, 302, 303, 307, 308) or not location:
+                break
+            url = urljoin(url, location)
+        
+        return (status_code, response_headers, body)
+    
+    def idle_count(self, url: str) -> int:
+        """Number of idle pooled connections to url's host."""
+        parsed = urlparse(url)
+        with self._lock:
+            return len(self._pools.get((parsed.scheme, parsed.netloc), []))
+    
+    def warm(self, url: str) -> None:
+        """Open one more connection to url's host ahead of time (DNS, TCP and TLS) and pool it."""
+        parsed = urlparse(url)
+        conn = self._new_connection(parsed.scheme, parsed.netloc)
+        try:
+            conn.connect()
+        except (OSError, http.client.HTTPException):
+            # The real request will report the problem
+            conn.close()
+            return
+        self._release(parsed.scheme, parsed.netloc, conn)
+    
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+    
+    def __enter__(self) -> 'HTTPSession':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LinkCache:
+    """
+    Persistent cache of link check results, backed by SQLite.
+    
+    Keyed by URL, storing (status_code, etag, last_modified, timestamp).
+    Entries younger than max_age seconds let a run skip the network for links
+    that passed recently. Definitive "not found" answers are kept for the
+    shorter negative_max_age so a known-broken link isn't re-fetched on every
+    run; other errors are never stored, so transient failures are always
+    re-checked. Expired successful entries keep their ETag/Last-Modified
+    validators, so they can be refreshed with a cheap conditional request.
+    """
+    
+    SCHEMA_VERSION = 2
+    NEGATIVE_STATUSES = frozenset({404, 410})
+    
+    def __init__(self, path: str, max_age: int = 86400, negative_max_age: int = 3600):
+        self.path = path
+        self.max_age = max_age
+        self.negative_max_age = negative_max_age
+        self._entries: dict[str, tuple[int, Optional[str], Optional[str], int]] = {}
+        self._dirty: set[str] = set()
+        # Workers record validators concurrently
+        self._lock = threading.Lock()
+        
+        if os.path.exists(path):
+            self._load()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            # Cache files are disposable, start over on schema changes
+            conn.execute('DROP TABLE IF EXISTS links')
+            conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS links '
+            '(url TEXT PRIMARY KEY, status INT, etag TEXT, last_modified TEXT, ts INT)'
+        )
+        return conn
+    
+    def _load(self) -> None:
+        with closing(self._connect()) as conn:
+            for url, status, etag, last_modified, ts in conn.execute(
+                'SELECT url, status, etag, last_modified, ts FROM links'
+            ):
+                self._entries[url] = (status, etag, last_modified, ts)
+    
+    def get(self, url: str) -> Optional[int]:
+        """Return the cached status code if a fresh entry exists."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        
+        status, _, _, ts = entry
+        age = time.time() - ts
+        if 200 <= status < 400 and age < self.max_age:
+            return status
+        if status in self.NEGATIVE_STATUSES and age < self.negative_max_age:
+            return status
+        return None
+    
+    def validators(self, url: str) -> Optional[tuple[int, Optional[str], Optional[str]]]:
+        """
+        Return validators of a successful entry, fresh or not.
+        
+        Returns: (status_code, etag, last_modified), or None if there is nothing to revalidate
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        
+        status, etag, last_modified, _ = entry
+        if not 200 <= status < 400 or not (etag or last_modified):
+            return None
+        return (status, etag, last_modified)
+    
+    def put(self, url: str, status: int, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Record a successful or definitive "not found" check result.
+        
+        Validators that aren't given are carried over from an existing successful entry.
+        """
+        if not (200 <= status < 400 or status in self.NEGATIVE_STATUSES):
+            return
+        
+        with self._lock:
+            previous = self._entries.get(url)
+            if previous and 200 <= status < 400 and 200 <= previous[0] < 400:
+                etag = etag or previous[1]
+                last_modified = last_modified or previous[2]
+            self._entries[url] = (status, etag, last_modified, int(time.time()))
+            self._dirty.add(url)
+    
+    def save(self) -> None:
+        """Write new and refreshed entries back to disk."""
+        if not self._dirty:
+            return
+        
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO links (url, status, etag, last_modified, ts) VALUES (?, ?, ?, ?, ?)',
+                [(url, *self._entries[url]) for url in self._dirty]
+            )
+        self._dirty.clear()
+
+
+def extract_links_from_readme(filepath: str) -> tuple[list[tuple[str, str, int, str]], ReadmeSource]:
+    """
+    Extract all skill links from README.md.
+    
+    The file is memory-mapped and stays mapped in the returned ReadmeSource,
+    which delete_invalid_lines reuses; close it when done.
+    
+    Returns: ([(skill_name, url, line_num, original_line), ...], source)
+    """
     links = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            match = pattern.search(line)
-            if match:
-                name, url = match.groups()
-                links.append((name, url, line_num, line.rstrip('\n')))
+    with open(filepath, 'rb') as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return (links, ReadmeSource(buf=b'', newlines=array('L')))
+        
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    # Offsets of every newline, so a match position maps to its line with bisect
+    source = ReadmeSource(buf=buf, newlines=array('L', (m.start() for m in NEWLINE_RE.finditer(buf))))
+    
+    last_line_num = 0
+    for match in LINK_RE.finditer(buf):
+        line_num = bisect.bisect_left(source.newlines, match.start()) + 1
+        # Only the first link on a line counts
+        if line_num == last_line_num:
+            continue
+        last_line_num = line_num
+        
+        start, end = source.line_span(line_num)
+        name, url = (group.decode('utf-8') for group in match.groups())
+        original_line = buf[start:end].rstrip(b'\n').rstrip(b'\r').decode('utf-8')
+        links.append((name, url, line_num, original_line))
+    
+    return (links, source)
+
+
+def interpret_status(status_code: int) -> tuple[int, Optional[str], bool]:
+    """
+    Map an HTTP status code to a link check outcome.
+    
+    Returns: (status_code, error_msg, is_valid)
+    """
+    if 200 <= status_code < 400:
+        return (status_code, None, True)
+    
+    if status_code == 404:
+        error_msg = "Not Found"
+        is_valid = False
+    elif status_code == 403:
+        error_msg = "Forbidden (rate limited?)"
+        # Rate limiting means the resource exists but is temporarily inaccessible
+        is_valid = True
+    elif status_code == 429:
+        error_msg = "Too Many Requests"
+        # Still rate limited after the session's retries: the resource is
+        # temporarily inaccessible, not missing
+        is_valid = True
+    else:
+        error_msg = f"HTTP {status_code}"
+        is_valid = False
+    
+    return (status_code, error_msg, is_valid)
+
+
+def parse_github_tree_url(url: str) -> Optional[tuple[str, str, str, str]]:
+    """
+    Split a github.com tree link into its repository parts.
+    
+    e.g.: https://github.com/openclaw/skills/tree/main/skills/author/skill-name/SKILL.md
+    -> ('openclaw', 'skills', 'main', 'skills/author/skill-name/SKILL.md')
+    
+    Returns: (owner, repo, branch, path), or None for other URLs
+    """
+    parsed = urlparse(url)
+    if parsed.netloc != 'github.com':
+        return None
+    
+    path_parts = parsed.path.split('/')
+    if len(path_parts) < 6 or path_parts[3] != 'tree':
+        return None
+    
+    file_path = unquote('/'.join(path_parts[5:])).strip('/')
+    return (path_parts[1], path_parts[2], path_parts[4], file_path)
+
+
+def fetch_repo_tree(
+    session: HTTPSession,
+    owner: str,
+    repo: str,
+    branch: str,
+    wanted: list[str],
+    tokens: TokenPool,
+    executor: ThreadPoolExecutor
+) -> Optional[RepoTree]:
+    """
+    List a repository's paths with the Git Trees API, so many links can be
+    checked with a handful of requests instead of one contents call each.
+    
+    A recursive listing is tried first. When GitHub truncates it (very large
+    repositories), the directory is listed non-recursively instead and only
+    subdirectories holding at least two wanted paths are descended into, one
+    level at a time with the listings of a level run in parallel on executor.
+    A subdirectory holding every wanted path of its truncated parent skips the
+    recursive attempt, which would only be truncated again. The remaining
+    paths are left for per-link checks.
     
-    return links
+    Returns: RepoTree, or None if the tree couldn't be fetched
+    """
+    api_base = f"https://api.github.com/repos/{owner}/{repo}/git/trees"
+    
+    # Number of wanted paths below each directory
+    wanted_counts: dict[str, int] = {}
+    for path in wanted:
+        parent = path
+        while parent:
+            parent = parent.rpartition('/')[0]
+            wanted_counts[parent] = wanted_counts.get(parent, 0) + 1
+    
+    tree = RepoTree(paths=set(), listed=set(), complete=set())
+    tree_lock = threading.Lock()
+    
+    def get_tree(tree_ish: str, recursive: bool) -> Optional[dict]:
+        url = f"{api_base}/{quote(tree_ish, safe='')}" + ('?recursive=1' if recursive else '')
+        headers = {'Accept': 'application/vnd.github+json'}
+        github_token = tokens.next()
+        if github_token:
+            headers['Authorization'] = f'token {github_token}'
+        
+        try:
+            status_code, response_headers, body = session.request('GET', url, headers)
+            tokens.update(github_token, response_headers)
+            if status_code != 200:
+                return None
+            return json.loads(body)
+        except (OSError, ValueError, http.client.HTTPException):
+            return None
+    
+    def list_dir(item: tuple[str, str, bool]) -> Optional[list[tuple[str, str, bool]]]:
+        """
+        List one directory into tree.
+        
+        Returns: subdirectories to descend into as (tree_ish, directory, try_recursive),
+            or None if the listing failed
+        """
+        tree_ish, directory, try_recursive = item
+        prefix = f"{directory}/" if directory else ''
+        
+        if try_recursive:
+            data = get_tree(tree_ish, recursive=True)
+            if data is None:
+                return None
+            # Entries of a truncated listing still exist, keep them either way
+            with tree_lock:
+                tree.paths.update(prefix + entry['path'] for entry in data['tree'])
+                if not data.get('truncated'):
+                    tree.complete.add(directory)
+                    return []
+        
+        data = get_tree(tree_ish, recursive=False)
+        if data is None or data.get('truncated'):
+            return None
+        
+        subdirs = []
+        with tree_lock:
+            tree.listed.add(directory)
+            for entry in data['tree']:
+                path = prefix + entry['path']
+                tree.paths.add(path)
+                count = wanted_counts.get(path, 0)
+                if entry['type'] == 'tree' and count >= 2:
+                    subdirs.append((entry['sha'], path, count < wanted_counts[directory]))
+        return subdirs
+    
+    try:
+        level = list_dir((branch, '', True))
+        if level is None and not tree.paths:
+            return None
+        
+        while level:
+            next_level = []
+            for subdirs in executor.map(list_dir, level):
+                next_level.extend(subdirs or [])
+            level = next_level
+    except (KeyError, TypeError):
+        # Malformed listing, leave every link to the per-link checks
+        return None
+    return tree
 
 
-def check_link(name: str, url: str, github_token: Optional[str], timeout: int = 10) -> tuple[Optional[int], Optional[str], bool]:
+def check_link(
+    session: HTTPSession,
+    name: str,
+    url: str,
+    tokens: TokenPool,
+    repo_trees: Optional[dict[tuple[str, str, str], RepoTree]] = None,
+    cache: Optional[LinkCache] = None
+) -> tuple[Optional[int], Optional[str], bool]:
     """
-    Check a single link's validity using HEAD request.
+    Check a single link's validity using HEAD request, falling back to a
+    1-byte ranged GET when the server rejects HEAD.
+    
+    Requests go through the shared session so keep-alive connections are reused.
+    GitHub tree links covered by a prefetched entry in repo_trees are answered
+    without any request.
+    
+    With a cache, a previously successful link is revalidated conditionally
+    (If-None-Match / If-Modified-Since). A 304 reply confirms it is still
+    valid and doesn't count against the GitHub API rate limit.
     
     For GitHub links, use GITHUB_TOKEN for authentication to increase API limits.
     GitHub API limits:
     - Unauthenticated: 60 requests/hour
-    - Authenticated: 5000 requests/hour
+    - Authenticated: 5000 requests/hour per token
+    Requests rotate through all tokens in the pool.
     
     Returns: (status_code, error_msg, is_valid)
     """
-    # Build request
-    parsed = urlparse(url)
-    
     # Convert github.com links to API calls for more accurate status
     # e.g.: https://github.com/openclaw/skills/tree/main/skills/xxx/SKILL.md
     # -> https://api.github.com/repos/openclaw/skills/contents/skills/xxx/SKILL.md?ref=main
+    is_github = urlparse(url).netloc == 'github.com'
+    github_target = parse_github_tree_url(url)
     
-    is_github = parsed.netloc == 'github.com'
-    
-    if is_github:
-        # Parse GitHub URL path
-        path_parts = parsed.path.split('/')
-        # /openclaw/skills/tree/main/skills/author/skill-name/SKILL.md
-        if len(path_parts) >= 6 and path_parts[3] == 'tree':
-            repo_owner = path_parts[1]
-            repo_name = path_parts[2]
-            branch = path_parts[4]
-            file_path = '/'.join(path_parts[5:])
-            
-            # Build GitHub API URL
-            api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/contents/{file_path}?ref={branch}"
-            check_url = api_url
-        else:
-            check_url = url
+    if github_target:
+        repo_owner, repo_name, branch, file_path = github_target
+        
+        # Answer from the prefetched repository tree when it covers this path
+        repo_tree = (repo_trees or {}).get((repo_owner, repo_name, branch))
+        exists = repo_tree.contains(file_path) if repo_tree else None
+        if exists is not None:
+            return interpret_status(200 if exists else 404)
+        
+        # Build GitHub API URL
+        check_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/contents/{quote(file_path)}?ref={branch}"
     else:
         check_url = url
     
-    # Create request
-    req = urllib.request.Request(check_url, method='HEAD')
-    
     # Set headers
-    req.add_header('User-Agent', 'awesome-openclaw-skills-link-checker/1.0')
+    headers = {}
+    github_token = tokens.next() if is_github else None
     
-    if is_github and github_token:
-        req.add_header('Authorization', f'token {github_token}')
+    if github_token:
+        headers['Authorization'] = f'token {github_token}'
         # GitHub API requires Accept header
-        req.add_header('Accept', 'application/vnd.github.v3+json')
+        headers['Accept'] = 'application/vnd.github.v3+json'
     
-    # Create SSL context
-    ssl_context = ssl.create_default_context()
+    validators = cache.validators(url) if cache is not None else None
+    if validators:
+        _, etag, last_modified = validators
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
     
     try:
-        with urllib.request.urlopen(req, timeout=timeout, context=ssl_context) as response:
-            # For GitHub API, HEAD requests may not be supported, handle it
-            if isinstance(response, HTTPResponse):
-                status_code = response.status
-            else:
-                status_code = 200
-            
-            is_valid = 200 <= status_code < 400
-            
-            return (status_code, None, is_valid)
-    
-    except urllib.error.HTTPError as e:
-        status_code = e.code
-        error_msg = None
-        
-        if status_code == 404:
-            error_msg = "Not Found"
-            is_valid = False
-        elif status_code == 403:
-            error_msg = "Forbidden (rate limited?)"
-            # Rate limiting means the resource exists but is temporarily inaccessible
-            is_valid = True
-        elif status_code == 429:
-            error_msg = "Too Many Requests"
-            # Rate limiting means the resource exists but is temporarily inaccessible
-            is_valid = True
-        else:
-            error_msg = f"HTTP {status_code}"
-            is_valid = False
+        status_code, response_headers, _ = session.request('HEAD', check_url, headers)
+        tokens.update(github_token, response_headers)
         
-        return (status_code, error_msg, is_valid)
-    
-    except urllib.error.URLError as e:
-        return (None, f"URL Error: {e.reason}", False)
+        # Some servers answer HEAD with 403/405/501 for resources that exist,
+        # confirm with a 1-byte GET unless the 403 is a GitHub rate limit
+        if status_code in (403, 405, 501) and response_headers.get('X-RateLimit-Remaining') != '0':
+            status_code, response_headers, _ = session.request('GET', check_url, {**headers, 'Range': 'bytes=0-0'})
+            tokens.update(github_token, response_headers)
+            if status_code == 416:
+                # Range not satisfiable: the resource is empty, but it exists
+                status_code = 200
     
     except TimeoutError:
         return (None, "Timeout", False)
     
+    except OSError as e:
+        return (None, f"URL Error: {e}", False)
+    
     except Exception as e:
         return (None, f"Error: {str(e)}", False)
+    
+    if status_code == 304 and validators:
+        # Not modified: the cached result still holds, only its timestamp is refreshed
+        status_code = validators[0]
+    
+    if cache is not None:
+        cache.put(url, status_code, response_headers.get('ETag'), response_headers.get('Last-Modified'))
+    
+    return interpret_status(status_code)
 
 
 def check_all_links(
     links: list[tuple[str, str, int, str]],
-    github_token: Optional[str],
+    tokens: TokenPool,
     max_workers: int = 10,
-    rate_limit_delay: float = 0.1
+    requests_per_second: Optional[float] = None,
+    cache: Optional[LinkCache] = None,
+    fail_fast: bool = False
 ) -> list[LinkResult]:
     """
     Check all links concurrently.
     
     Args:
         links: [(name, url, line_num, original_line), ...]
-        github_token: GitHub personal access token
+        tokens: GitHub personal access tokens to rotate through
         max_workers: Maximum number of concurrent workers
-        rate_limit_delay: Delay between requests (in seconds)
+        requests_per_second: Maximum request rate across all workers (None for unlimited)
+        cache: Optional persistent cache; fresh entries skip the network and
+            successful or "not found" results are recorded into it
+        fail_fast: Stop at the first invalid link; links not checked by then
+            are left out of the results
     """
+    # One session for the whole run: workers share pooled keep-alive connections
+    # and a single token bucket paces their requests to avoid triggering rate limits
+    # Set to stop the run early (fail_fast); also cuts retry backoff short
+    stop = threading.Event()
+    rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+    session = HTTPSession(pool_maxsize=max_workers, rate_limiter=rate_limiter, stop_event=stop)
     results = []
     total = len(links)
     
-    print(f"Checking {total} links...")
+    # Many README lines can point at the same target, check each unique URL only once
+    links_by_url: dict[str, list[tuple[str, str, int, str]]] = {}
+    for link in links:
+        links_by_url.setdefault(link[1], []).append(link)
+    
+    # Links that passed recently don't need to be requested again
+    cached = {}
+    if cache is not None:
+        for url in links_by_url:
+            status_code = cache.get(url)
+            if status_code is not None:
+                cached[url] = interpret_status(status_code)
+    
+    print(f"Checking {total} links ({len(links_by_url)} unique URLs)...")
+    if cache is not None:
+        print(f"Cached: {len(cached)} (max age: {cache.max_age}s, not found: {cache.negative_max_age}s)")
     print(f"Concurrency: {max_workers}")
-    print(f"GITHUB_TOKEN: {'set' if github_token else 'not set (limit: 60/hour)'}")
-    print("-" * 60)
-    
-    def check_with_delay(link_tuple):
-        name, url, line_num, original_line = link_tuple
-        status_code, error, is_valid = check_link(name, url, github_token)
-        time.sleep(rate_limit_delay)  # Add delay to avoid triggering rate limits
-        return LinkResult(
-            name=name,
-            url=url,
-            line_num=line_num,
-            original_line=original_line,
-            status_code=status_code,
-            error=error,
-            is_valid=is_valid
-        )
+    print(f"Rate limit: {f'{requests_per_second:g} requests/second' if requests_per_second else 'none'}")
+    print(f"GITHUB_TOKEN: {f'{len(tokens)} set' if tokens else 'not set (limit: 60/hour)'}")
+    
+    # With fail_fast, a cached broken link already decides the outcome
+    if fail_fast and any(not is_valid for _, _, is_valid in cached.values()):
+        stop.set()
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(check_with_delay, link): link
-            for link in links
-        }
+    # Group remaining GitHub tree links by repository, one tree listing can cover them all
+    wanted_by_repo: dict[tuple[str, str, str], list[str]] = {}
+    for url in links_by_url:
+        github_target = parse_github_tree_url(url)
+        if url not in cached and github_target:
+            owner, repo, branch, file_path = github_target
+            wanted_by_repo.setdefault((owner, repo, branch), []).append(file_path)
+    
+    # Open the session before the first request so pooled connections are
+    # always closed, even if something below fails
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        repo_trees = {}
+        for (owner, repo, branch), wanted in wanted_by_repo.items():
+            if len(wanted) < 2 or stop.is_set():
+                continue
+            repo_tree = fetch_repo_tree(session, owner, repo, branch, wanted, tokens, executor)
+            if repo_tree is None:
+                print(f"Repo tree: {owner}/{repo}@{branch} unavailable, checking links one by one")
+                continue
+            repo_trees[(owner, repo, branch)] = repo_tree
+            covered = sum(1 for path in wanted if repo_tree.contains(path) is not None)
+            print(f"Repo tree: {owner}/{repo}@{branch} covers {covered}/{len(wanted)} links")
+        
+        print("-" * 60)
         
+        def check_unless_stopped(name: str, url: str) -> Optional[tuple[Optional[int], Optional[str], bool]]:
+            # Another worker already found a broken link
+            if stop.is_set():
+                return None
+            return check_link(session, name, url, tokens, repo_trees, cache)
+        
+        progress = ProgressPrinter()
         completed = 0
-        for future in as_completed(futures):
-            completed += 1
-            result = future.result()
-            results.append(result)
+        
+        def report(url: str, outcome: tuple[Optional[int], Optional[str], bool]) -> None:
+            nonlocal completed
+            status_code, error, is_valid = outcome
             
-            # Show progress (always print URL)
-            status_icon = "✓" if result.is_valid else "✗"
-            if result.is_valid:
-                print(f"[{completed}/{total}] {status_icon} {result.name}")
-                print(f"    {result.url}")
+            if cache is not None and status_code is not None and url not in cached:
+                cache.put(url, status_code)
+            
+            for name, url, line_num, original_line in links_by_url[url]:
+                completed += 1
+                result = LinkResult(
+                    name=name,
+                    url=url,
+                    line_num=line_num,
+                    original_line=original_line,
+                    status_code=status_code,
+                    error=error,
+                    is_valid=is_valid
+                )
+                results.append(result)
+                
+                # Show progress (always print URL)
+                status_icon = "✓" if result.is_valid else "✗"
+                if result.is_valid:
+                    progress.print(f"[{completed}/{total}] {status_icon} {result.name}\n    {result.url}")
+                else:
+                    error_info = result.error or f"HTTP {result.status_code}"
+                    progress.print(f"[{completed}/{total}] {status_icon} {result.name} - {error_info}\n    {result.url}")
+        
+        for url, outcome in cached.items():
+            report(url, outcome)
+        
+        pending_urls = [url for url in links_by_url if url not in cached and not stop.is_set()]
+        
+        # Count the requests each host will get; links answered by a repo tree need none,
+        # other GitHub tree links are checked through the API host
+        requests_by_origin: dict[str, int] = {}
+        for url in pending_urls:
+            github_target = parse_github_tree_url(url)
+            if github_target:
+                owner, repo, branch, file_path = github_target
+                repo_tree = repo_trees.get((owner, repo, branch))
+                if repo_tree and repo_tree.contains(file_path) is not None:
+                    continue
+                origin = 'https://api.github.com/'
             else:
-                error_info = result.error or f"HTTP {result.status_code}"
-                print(f"[{completed}/{total}] {status_icon} {result.name} - {error_info}")
-                print(f"    {result.url}")
-    
+                origin = urljoin(url, '/')
+            requests_by_origin[origin] = requests_by_origin.get(origin, 0) + 1
+        
+        # Up to one connection per worker that will talk to each host, on top of
+        # those already pooled (e.g. by the tree listing)
+        warm_ups = [
+            origin
+            for origin, count in requests_by_origin.items()
+            for _ in range(min(max_workers, count) - session.idle_count(origin))
+        ]
+        
+        with progress:
+            # Pay DNS + TCP + TLS up front, in parallel, before the fan-out
+            # so the first wave of checks doesn't queue behind slow handshakes
+            list(executor.map(session.warm, warm_ups))
+            
+            futures = {
+                executor.submit(check_unless_stopped, links_by_url[url][0][0], url): url
+                for url in pending_urls
+            }
+            
+            for future in as_completed(futures):
+                outcome = future.result()
+                if outcome is None:
+                    continue
+                report(futures[future], outcome)
+                
+                if fail_fast and not outcome[2]:
+                    # Drop queued checks, only requests already in flight are waited for
+                    stop.set()
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        
     return results
 
 
-def delete_invalid_lines(readme_path: str, results: list[LinkResult]) -> int:
+def delete_invalid_lines(readme_path: str, results: list[LinkResult], source: ReadmeSource) -> int:
     """
     Delete lines with invalid links from README.md.
     
+    The new contents are sliced from the source kept by extract_links_from_readme
+    and written in one go. The source is closed before the file is rewritten.
+    
     Returns: Number of deleted lines
     """
     # Collect line numbers to delete
@@ -219,27 +1028,65 @@ def delete_invalid_lines(readme_path: str, results: list[LinkResult]) -> int:
     if not invalid_lines:
         return 0
     
-    # Read all lines
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    # Keep everything between the deleted lines
+    chunks = []
+    kept_from = 0
+    for line_num in sorted(invalid_lines):
+        start, end = source.line_span(line_num)
+        chunks.append(source.buf[kept_from:start])
+        kept_from = end
+    chunks.append(source.buf[kept_from:])
+    content = b''.join(chunks)
     
-    # Filter out invalid lines
-    new_lines = [
-        line for line_num, line in enumerate(lines, 1)
-        if line_num not in invalid_lines
-    ]
+    # The mapping must be gone before the file is truncated
+    source.close()
     
     # Write back to file
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
+    with open(readme_path, 'wb') as f:
+        f.write(content)
     
     return len(invalid_lines)
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value!r}")
+    return number
+
+
+def non_negative_float(value: str) -> float:
+    """argparse type for rates, where 0 means unlimited"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    # Also rejects NaN
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {value!r}")
+    return number
+
+
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Check the validity of links in README.md')
     parser.add_argument('--delete', action='store_true', help='Delete lines with invalid links')
+    parser.add_argument('--max-workers', type=positive_int, default=None,
+                        help='Number of concurrent requests (default: 20 with GITHUB_TOKEN, 5 without)')
+    parser.add_argument('--requests-per-second', type=non_negative_float, default=None,
+                        help='Maximum request rate, 0 for unlimited (default: 50 per GitHub token, 5 without)')
+    parser.add_argument('--cache-path', default=None,
+                        help='SQLite file caching results between runs (default: no cache)')
+    parser.add_argument('--max-cache-age', type=int, default=86400,
+                        help='Seconds a cached successful result stays valid (default: 86400)')
+    parser.add_argument('--max-negative-cache-age', type=int, default=3600,
+                        help='Seconds a cached "not found" result stays valid (default: 3600)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop checking as soon as one invalid link is found')
     args = parser.parse_args()
     
     # Get README.md path
@@ -250,46 +1097,65 @@ def main():
         print(f"Error: Cannot find README.md file: {readme_path}")
         sys.exit(1)
     
-    # Get GITHUB_TOKEN
-    github_token = os.environ.get("GITHUB_TOKEN")
+    # Get GITHUB_TOKEN, plus any extra comma-separated tokens in GITHUB_TOKENS
+    github_tokens = [os.environ.get("GITHUB_TOKEN", "")] + os.environ.get("GITHUB_TOKENS", "").split(",")
+    tokens = TokenPool(list(dict.fromkeys(token.strip() for token in github_tokens if token.strip())))
     
     # Extract links
     print(f"Reading {readme_path}...")
-    links = extract_links_from_readme(readme_path)
+    links, source = extract_links_from_readme(readme_path)
     print(f"Found {len(links)} links")
     print()
     
     if not links:
+        source.close()
         print("No links found")
         sys.exit(0)
     
     # Check links
     # For GitHub API, higher concurrency is possible with token
     # Without token, reduce concurrency to avoid triggering rate limits
-    max_workers = 20 if github_token else 5
-    rate_limit_delay = 0.05 if github_token else 0.5
+    # Workers spend almost all their time blocked on sockets, so with a token
+    # the concurrency can be raised well beyond the default via --max-workers
+    max_workers = args.max_workers if args.max_workers is not None else (20 if tokens else 5)
+    # Each token has its own quota, so the default rate grows with the token count
+    if args.requests_per_second is not None:
+        requests_per_second = args.requests_per_second
+    else:
+        requests_per_second = 50 * len(tokens) if tokens else 5
+    
+    cache = LinkCache(args.cache_path, args.max_cache_age, args.max_negative_cache_age) if args.cache_path else None
     
     results = check_all_links(
         links,
-        github_token,
+        tokens,
         max_workers=max_workers,
-        rate_limit_delay=rate_limit_delay
+        requests_per_second=requests_per_second,
+        cache=cache,
+        fail_fast=args.fail_fast
     )
     
+    if cache is not None:
+        cache.save()
+    
     # Print summary
     print()
     print("=" * 60)
     valid_count = sum(1 for r in results if r.is_valid)
     invalid_count = len(results) - valid_count
     print(f"Check complete: {valid_count} valid, {invalid_count} invalid")
+    if len(results) < len(links):
+        print(f"Skipped {len(links) - len(results)} links after the first failure (--fail-fast)")
     
     # Delete invalid lines if requested
     if args.delete and invalid_count > 0:
         print()
         print("Deleting invalid links...")
-        deleted = delete_invalid_lines(readme_path, results)
+        deleted = delete_invalid_lines(readme_path, results, source)
         print(f"Deleted {deleted} lines")
     
+    source.close()
+    
     # Return exit code
     if invalid_count > 0:
         sys.exit(1)